@@ -1,11 +1,13 @@
 """AI manager for orchestrating multiple AI models with progressive updates."""
 
 import asyncio
-import json
-from datetime import datetime
+import functools
+import string
+from html import escape
 from pathlib import Path
 from typing import Callable, Dict, Optional, Any, Awaitable
 
+import orjson
 import structlog
 
 from ..config import Settings, AIModelConfig
@@ -14,9 +16,18 @@ from .ollama import OllamaProvider
 
 ERROR_TEMPLATE_PATH = Path(__file__).parent.parent.parent / "static" / "templates" / "error.html"
 
+# Minimum delay in seconds between progressive updates of a single model
+PROGRESS_UPDATE_INTERVAL = 5.0
+
 logger: structlog.stdlib.BoundLogger = structlog.get_logger()
 
 
+@functools.cache
+def _load_error_template() -> string.Template:
+    """Read the error page template once per process."""
+    return string.Template(ERROR_TEMPLATE_PATH.read_text())
+
+
 class AIManager:
     """Orchestrates AI model requests with progressive updates."""
 
@@ -28,10 +39,10 @@ class AIManager:
         """
         self.settings = settings
         self.providers: Dict[str, AIProvider] = {}
-        self._error_template = ERROR_TEMPLATE_PATH.read_text()
+        self._prompt_cache: tuple[str, str] | None = None
 
         # Initialize Ollama provider
-        self.providers["ollama"] = OllamaProvider(settings.ollama)
+        self.providers["ollama"] = OllamaProvider(settings.ollama, max_connections=settings.ai.max_concurrent or None)
 
     async def generate_all(
         self,
@@ -48,43 +59,32 @@ class AIManager:
         Returns:
             Dictionary mapping model names to generated HTML
         """
-        # Prepare prompt with pretty-printed JSON
-        try:
-            weather_obj = json.loads(weather_json)
-            weather_json_formatted = json.dumps(weather_obj, indent=2)
-        except json.JSONDecodeError:
-            logger.warning("json_parse_failed", using_raw=True)
-            weather_json_formatted = weather_json
+        prompt = self._build_prompt(weather_json)
+        results: Dict[str, str] = {}
 
-        prompt = self.settings.prompt.template.format(weather_json=weather_json_formatted)
-
-        async def generate_with_callback(model_name: str, model_config: AIModelConfig) -> tuple[str, str]:
-            """Generate and call callback when done.
+        async def generate_with_callback(model_name: str, model_config: AIModelConfig) -> None:
+            """Generate, store the result and call callback when done.
 
             Args:
                 model_name: Name of the model
                 model_config: Model configuration
-
-            Returns:
-                Tuple of (model_name, html)
             """
+            log = logger.bind(model=model_name)
             try:
-                # Type check to ensure model_config has the right attributes
-                if not hasattr(model_config, "provider"):
-                    raise AttributeError("model_config missing provider attribute")
-
                 provider = self.providers.get(model_config.provider)
                 if not provider:
                     raise Exception(f"Provider {model_config.provider} not found")
 
-                last_update = datetime.now()
+                loop = asyncio.get_running_loop()
+                last_update = loop.time()
 
                 # Create a model-specific chunk callback
                 async def model_chunk_callback(accumulated_html: str) -> None:
                     nonlocal last_update
                     if on_update:
-                        if (datetime.now() - last_update).seconds >= 5:
-                            last_update = datetime.now()
+                        now = loop.time()
+                        if now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                            last_update = now
                             await on_update(model_name, accumulated_html, False)
 
                 html = await asyncio.wait_for(
@@ -96,43 +96,79 @@ class AIManager:
                     ),
                     timeout=model_config.timeout,
                 )
+                results[model_name] = html
 
                 # Call callback immediately when this model completes
                 if on_update:
                     await on_update(model_name, html, True)
 
-                return model_name, html
-
             except Exception as e:
-                logger.error("model_failed", model=model_name, error=str(e))
+                log.error("model_failed", error=str(e))
                 html = self._error_html(model_name, str(e))
+                results[model_name] = html
 
                 # Call callback even for errors
                 if on_update:
                     await on_update(model_name, html, True)
 
-                return model_name, html
+        async def run_model(model_config: AIModelConfig) -> None:
+            """Run one model, so a failing update callback doesn't affect the other models."""
+            try:
+                await generate_with_callback(model_config.name, model_config)
+            except Exception as e:
+                logger.error("model_update_failed", model=model_config.name, error=str(e))
 
-        generate_fn: Callable[[str, AIModelConfig], Awaitable[tuple[str, str]]]
+        enabled_models = [m for m in self.settings.ai_models if m.enabled]
 
         max_concurrent = self.settings.ai.max_concurrent
         if max_concurrent > 0:
-            # Limit concurrent requests
-            semaphore = asyncio.Semaphore(max_concurrent)
+            # Limit concurrent requests with a fixed pool of workers draining a queue
+            queue: asyncio.Queue[AIModelConfig] = asyncio.Queue()
+            for model_config in enabled_models:
+                queue.put_nowait(model_config)
+
+            async def worker() -> None:
+                while not queue.empty():
+                    await run_model(queue.get_nowait())
+
+            async with asyncio.TaskGroup() as group:
+                for _ in range(min(max_concurrent, len(enabled_models))):
+                    group.create_task(worker())
 
-            async def generate_limited(name: str, cfg: AIModelConfig) -> tuple[str, str]:
-                async with semaphore:
-                    return await generate_with_callback(name, cfg)
+            return results
 
-            generate_fn = generate_limited
-        else:
-            generate_fn = generate_with_callback
+        for completed in asyncio.as_completed([run_model(m) for m in enabled_models]):
+            await completed
 
-        tasks = [generate_fn(m.name, m) for m in self.settings.ai_models if m.enabled]
-        results = await asyncio.gather(*tasks)
+        return results
 
-        # Return as dict
-        return dict(results)
+    def _build_prompt(self, weather_json: str) -> str:
+        """Format the prompt template with the weather data, pretty-printed unless disabled in config.
+
+        The result is cached, so a repeated refresh with the same weather data skips the JSON round-trip.
+
+        Args:
+            weather_json: Raw JSON string of weather data from API
+
+        Returns:
+            Prompt for the AI models
+        """
+        # Compare the payload itself, a hash match alone could return the prompt of other data
+        if self._prompt_cache is not None and self._prompt_cache[0] == weather_json:
+            return self._prompt_cache[1]
+
+        weather_json_formatted = weather_json
+        if self.settings.prompt.pretty_json:
+            # Prepare prompt with pretty-printed JSON
+            try:
+                weather_obj = orjson.loads(weather_json)
+                weather_json_formatted = orjson.dumps(weather_obj, option=orjson.OPT_INDENT_2).decode()
+            except orjson.JSONDecodeError:
+                logger.warning("json_parse_failed", using_raw=True)
+
+        prompt = self.settings.prompt.template.format(weather_json=weather_json_formatted)
+        self._prompt_cache = (weather_json, prompt)
+        return prompt
 
     def _error_html(self, model_name: str, error: str) -> str:
         """Generate error HTML for failed generations.
@@ -144,4 +180,4 @@ class AIManager:
         Returns:
             HTML error page
         """
-        return self._error_template.format(model_name=model_name, error=error)
+        return _load_error_template().substitute(model_name=escape(model_name), error=escape(error))
@@ -4,79 +4,95 @@ from abc import ABC, abstractmethod
 
 
 class Strategy(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def normalize(self, html: str) -> str | None: ...
 
 
 class FindDoctypeNormalizer(Strategy):
+    __slots__ = ()
+
     def normalize(self, html: str) -> str | None:
-        parts = html.split("<!DOCTYPE html>", 1)
-        if len(parts) == 1:
+        start = html.find("<!DOCTYPE html>")
+        if start < 0:
             return None
-        [_, html] = parts
-        html = "<!DOCTYPE html>" + html
-        parts = html.split("</html>", 1)
-        if len(parts) == 1:
+        end = html.find("</html>", start)
+        if end < 0:
             return None
-        [html, _] = parts
-        html = html + "</html>"
-        return html
+        return html[start : end + len("</html>")]
 
 
 class FindHtmlNormalizer(Strategy):
+    __slots__ = ()
+
     def normalize(self, html: str) -> str | None:
-        parts = html.split("<html", 1)
-        if len(parts) == 1:
+        start = html.find("<html")
+        if start < 0:
             return None
-        [_, html] = parts
-        html = "<html" + html
-        parts = html.split("</html>", 1)
-        if len(parts) == 1:
+        end = html.find("</html>", start)
+        if end < 0:
             return None
-        [html, _] = parts
-        return html
+        return html[start : end + len("</html>")]
 
 
 class CodeBlockHtmlNormalizer(Strategy):
-    def find(self, lines: list[str], start: str) -> int | None:
-        for i, line in enumerate(lines):
-            if line.strip().startswith(start):
-                return i
-        return None
+    __slots__ = ()
 
     def normalize(self, html: str) -> str | None:
-        lines = html.splitlines()
-
-        if len(lines) < 3:
-            return None
-
-        block_start = self.find(lines, "```")
-        if block_start is None:
+        start = html.find("```")
+        if start < 0:
             return None
-
-        block_end = self.find(lines[block_start:], "```")
-        if block_end is None:
+        end = html.find("```", start + 3)
+        if end < 0:
             return None
-
-        return "\n".join(lines[block_start : block_start + block_end + 1])
+        return html[start : end + 3]
 
 
 class NoopNormalizer(Strategy):
+    __slots__ = ()
+
     def normalize(self, html: str) -> str | None:
         return html
 
 
 class HtmlNormalizer:
-    def __init__(self) -> None:
-        self.strategies = [
-            FindDoctypeNormalizer(),
-            FindHtmlNormalizer(),
-            CodeBlockHtmlNormalizer(),
-            NoopNormalizer(),
-        ]
+    # Strategies are stateless, so a single set is shared by all normalizers
+    _DOCTYPE_STRATEGY = FindDoctypeNormalizer()
+    _HTML_STRATEGY = FindHtmlNormalizer()
+    _STRATEGIES: tuple[Strategy, ...] = (
+        _DOCTYPE_STRATEGY,
+        _HTML_STRATEGY,
+        CodeBlockHtmlNormalizer(),
+        NoopNormalizer(),
+    )
+
+    def probe(self, html: str) -> Strategy | None:
+        """Pick a strategy from the start of the output, if it is unambiguous."""
+        head = html[:256].lstrip()
+        if head.startswith("<!DOCTYPE"):
+            return self._DOCTYPE_STRATEGY
+        if head.startswith("<html"):
+            return self._HTML_STRATEGY
+        return None
 
     def normalize(self, html: str) -> str:
-        for strategy in self.strategies:
+        # Fast path: the output already is a bare, complete document.
+        # Only the edges are stripped for the checks, the full copy is made just when it's returned.
+        if html[:256].lstrip().startswith("<!DOCTYPE") and html[-256:].rstrip().endswith("</html>"):
+            return html.strip()
+
+        # Most models answer with a bare document, so try the strategy matching its start first
+        probed = self.probe(html)
+        if probed is not None:
+            result = probed.normalize(html)
+            if result is not None:
+                return result
+
+        for strategy in self._STRATEGIES:
+            if strategy is probed:
+                # Already tried above
+                continue
             result = strategy.normalize(html)
             if result is not None:
                 return result
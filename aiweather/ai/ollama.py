@@ -1,7 +1,9 @@
 """Ollama AI provider implementation."""
 
+import asyncio
 from collections.abc import Awaitable, Callable
 
+import httpx
 import ollama
 import structlog
 
@@ -10,18 +12,104 @@ from .base import AIProvider
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger()
 
+# Streamed chunks are coalesced before being passed to on_chunk:
+# emit at most ~15 times per second, or sooner once enough tokens piled up.
+CHUNK_EMIT_INTERVAL = 0.066
+CHUNK_EMIT_TOKENS = 32
+
+# Seconds an idle connection to Ollama is kept open for reuse
+KEEPALIVE_EXPIRY = 300
+
+
+class ChunkEmitter:
+    """Delivers snapshots to a callback with at most one call in flight.
+
+    Snapshots emitted while a call is still running replace each other,
+    only the newest one is delivered once the running call completes.
+    """
+
+    def __init__(self, callback: Callable[[str], Awaitable[None]]) -> None:
+        """Initialize chunk emitter.
+
+        Args:
+            callback: Callback to deliver snapshots to
+        """
+        self.callback = callback
+        self._task: asyncio.Task[None] | None = None
+        self._latest: str | None = None
+
+    def emit(self, snapshot: str) -> None:
+        """Deliver a snapshot in the background, or queue it if a delivery is running.
+
+        Raises:
+            Exception: If the previous delivery failed
+        """
+        if self._task is not None:
+            if not self._task.done():
+                self._latest = snapshot
+                return
+            # Surface a failed delivery
+            self._task.result()
+
+        self._task = asyncio.create_task(self._deliver(snapshot))
+
+    async def flush(self, snapshot: str | None = None) -> None:
+        """Wait for pending deliveries, then deliver the final snapshot if given.
+
+        Raises:
+            Exception: If any delivery failed
+        """
+        if self._task is not None:
+            await self._task
+            self._task = None
+        if snapshot is not None:
+            await self.callback(snapshot)
+
+    async def cancel(self) -> None:
+        """Cancel the running delivery, wait until it stops and drop the queued snapshot.
+
+        Once this returns, no callback is running, so whatever the caller delivers next
+        doesn't overlap with an unwinding snapshot delivery.
+        """
+        self._latest = None
+        task, self._task = self._task, None
+        if task is None:
+            return
+
+        task.cancel()
+        # Unlike awaiting the task, this doesn't raise its error or swallow our own cancellation
+        await asyncio.wait([task])
+        if not task.cancelled():
+            # Retrieve the error so it is not reported as unhandled, flush raises it on success
+            task.exception()
+
+    async def _deliver(self, snapshot: str) -> None:
+        await self.callback(snapshot)
+        while self._latest is not None:
+            snapshot, self._latest = self._latest, None
+            await self.callback(snapshot)
+
 
 class OllamaProvider(AIProvider):
     """Ollama AI provider implementation."""
 
-    def __init__(self, config: OllamaConfig) -> None:
+    def __init__(self, config: OllamaConfig, max_connections: int | None = None) -> None:
         """Initialize Ollama provider.
 
         Args:
             config: Ollama configuration
+            max_connections: Maximum number of connections to Ollama, None for no limit
         """
         self.config = config
-        self.client = ollama.AsyncClient(host=config.base_url, timeout=config.timeout)
+        self.client = ollama.AsyncClient(
+            host=config.base_url,
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
         logger.info("ollama_initialized", base_url=config.base_url, timeout=config.timeout)
 
     async def generate_html(
@@ -45,6 +133,7 @@ class OllamaProvider(AIProvider):
         Raises:
             Exception: If generation fails
         """
+        log = logger.bind(model=model_id)
         try:
             response = await self.client.generate(
                 model=model_id,
@@ -54,19 +143,44 @@ class OllamaProvider(AIProvider):
                 keep_alive=self.config.keep_alive,
             )
 
-            accumulated = ""
-            async for chunk in response:
-                text = chunk.get("response", "")
-                if text:
-                    accumulated += text
-                    if on_chunk:
-                        await on_chunk(accumulated)
-
-            logger.info("html_generated", model=model_id, length=len(accumulated))
-            return accumulated
+            loop = asyncio.get_running_loop()
+            emitter = ChunkEmitter(on_chunk) if on_chunk else None
+            parts: list[str] = []
+            last_emit = loop.time()
+            pending = 0
+            try:
+                async for chunk in response:
+                    text = chunk.get("response", "")
+                    if not text:
+                        continue
+
+                    parts.append(text)
+                    pending += 1
+                    if emitter and (loop.time() - last_emit >= CHUNK_EMIT_INTERVAL or pending >= CHUNK_EMIT_TOKENS):
+                        # Collapse the buffer into the snapshot, releasing the
+                        # per-token strings and keeping the list short
+                        snapshot = "".join(parts)
+                        parts = [snapshot]
+                        pending = 0
+                        last_emit = loop.time()
+                        # A slow consumer doesn't hold up the stream
+                        emitter.emit(snapshot)
+
+                # Joining a single-item list returns the item itself without copying
+                html = "".join(parts)
+
+                # Flush whatever arrived after the last emit
+                if emitter:
+                    await emitter.flush(html if pending else None)
+            finally:
+                if emitter:
+                    await emitter.cancel()
+
+            log.info("html_generated", length=len(html))
+            return html
 
         except Exception as e:
-            logger.error("html_generation_failed", model=model_id, error=str(e))
+            log.error("html_generation_failed", error=str(e))
             raise
 
     async def is_available(self) -> bool:
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Type, Tuple
+from typing import List, Literal, Type, Tuple
 
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict, PydanticBaseSettingsSource, YamlConfigSettingsSource
@@ -49,6 +49,9 @@ class PromptConfig(BaseModel):
     """Prompt template configuration."""
 
     template: str = Field(description="Prompt template with {weather_json} placeholder")
+    pretty_json: bool = Field(
+        default=True, description="Pretty-print the weather JSON in the prompt, otherwise pass it as received"
+    )
 
     @field_validator("template")
     @classmethod
@@ -82,6 +85,9 @@ class Settings(BaseSettings):
     prompt: PromptConfig
     scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
     storage: StorageConfig = Field(default_factory=StorageConfig)
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
+        default="INFO", description="Minimum level of logged events"
+    )
 
     model_config = SettingsConfigDict(
         env_file=Path(".env"),
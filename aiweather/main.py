@@ -1,5 +1,7 @@
 """Main FastAPI application for AI Weather."""
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
@@ -14,13 +16,26 @@ from .state import StateService
 from .storage import ArchiveManager
 from .websocket import ConnectionManager
 
-structlog.configure(
-    processors=[
-        structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer(),
-    ]
-)
+
+def configure_logging(level: int) -> None:
+    """Configure structlog output.
+
+    Args:
+        level: Minimum level of logged events
+    """
+    structlog.configure(
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.dev.ConsoleRenderer(),
+        ],
+        # Drop events below the level before any processing
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+    )
+
+
+# Until settings are loaded
+configure_logging(logging.INFO)
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger()
 
@@ -37,8 +52,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Startup and shutdown logic."""
     global scheduler, archive, settings, manager, state_service
 
+    # Let tasks that finish without suspending complete right away, skipping a loop iteration
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     settings = load_settings()
-    logger.info("config_loaded")
+    configure_logging(logging.getLevelNamesMapping()[settings.log_level])
+    logger.info("config_loaded", log_level=settings.log_level)
     archive = ArchiveManager(settings.storage.data_dir)
 
     # Initialize state service and load from the archive
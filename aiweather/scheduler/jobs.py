@@ -1,7 +1,8 @@
+import asyncio
 from datetime import datetime, timedelta
-import json
 from zoneinfo import ZoneInfo
 
+import orjson
 import structlog
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -87,7 +88,7 @@ class WeatherScheduler:
         await self.archive.save_weather(timestamp, weather_json)
 
         # Update state and broadcast weather data
-        weather_dict = json.loads(weather_json)
+        weather_dict = orjson.loads(weather_json)
         self.state_service.update_timestamp(timestamp.isoformat())
         self.state_service.update_weather(weather_dict)
         self.state_service.mark_all_outdated()
@@ -99,13 +100,17 @@ class WeatherScheduler:
         # Define callback for progressive updates
         async def on_visualization_update(model_name: str, html: str, is_complete: bool) -> None:
             """Called on each progressive update and on completion."""
-            await self.archive.save_visualization(timestamp, model_name, html)
             self.state_service.update_visualization(model_name, html)
             if is_complete:
                 self.state_service.mark_up_to_date(model_name)
             else:
                 self.state_service.mark_generating(model_name)
-            await self.ws_manager.broadcast_visualization(model_name)
+
+            # Disk write and client fan-out don't depend on each other
+            await asyncio.gather(
+                self.archive.save_visualization(timestamp, model_name, html),
+                self.ws_manager.broadcast_visualization(model_name),
+            )
 
         # Generate visualizations with streaming updates
         visualizations = await self.ai_manager.generate_all(
@@ -118,6 +123,7 @@ class WeatherScheduler:
     async def stop(self) -> None:
         """Stop the scheduler."""
         self.scheduler.shutdown()
+        await self.weather_client.aclose()
         logger.info("scheduler_stopped")
 
     async def needs_refresh(self) -> bool:
@@ -4,6 +4,7 @@ from typing import Any, Dict, Optional
 
 import structlog
 
+from ..ai.normalizer import HtmlNormalizer
 from ..config import Settings
 from ..storage import ArchiveManager
 
@@ -26,10 +27,12 @@ class StateService:
         """
         self.archive = archive
         self.settings = settings
+        self.normalizer = HtmlNormalizer()
 
         # State
         self.current_weather: Optional[Dict[str, Any]] = None
         self.current_visualizations: Dict[str, str] = {}
+        self.current_normalized_visualizations: Dict[str, str] = {}
         self.current_timestamp: Optional[str] = None
         self.visualization_status: Dict[str, str] = {}
 
@@ -50,6 +53,9 @@ class StateService:
         self.current_timestamp = latest["timestamp"]
         self.current_weather = latest.get("weather")
         self.current_visualizations = latest.get("visualizations", {})
+        self.current_normalized_visualizations = {
+            name: self.normalizer.normalize(html) for name, html in self.current_visualizations.items()
+        }
         self.visualization_status = {name: "up_to_date" for name in self.current_visualizations}
 
         logger.info(
@@ -80,11 +86,14 @@ class StateService:
     def update_visualization(self, model_name: str, html: str) -> None:
         """Update a visualization.
 
+        The cleaned up version of the HTML is computed here once, so readers don't have to normalize on every send.
+
         Args:
             model_name: Name of the AI model
             html: Generated HTML content
         """
         self.current_visualizations[model_name] = html
+        self.current_normalized_visualizations[model_name] = self.normalizer.normalize(html)
         logger.debug("state_viz_updated", model=model_name)
 
     def mark_all_outdated(self) -> None:
@@ -1,13 +1,28 @@
-import json
+import asyncio
+import contextlib
+import gzip
+import os
+import tempfile
+import zlib
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import aiofiles
+import orjson
 import structlog
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger()
 
+# Append-only list of saved hours (one JSON object per line), so the latest
+# hour can be found without walking the directory tree
+INDEX_FILENAME = "index.jsonl"
+
+# Visualizations are stored gzipped; the fastest level already shrinks HTML several times
+VISUALIZATION_COMPRESSLEVEL = 1
+
+# Number of resolved (and created) hourly directories kept in memory
+HOURLY_DIR_CACHE_SIZE = 64
+
 
 class ArchiveManager:
     """Manages weather visualization archives."""
@@ -20,6 +35,11 @@ class ArchiveManager:
         """
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._created_dirs: set[Path] = set()
+        self._filename_cache: dict[str, str] = {}
+        self._hourly_dir_cache: dict[tuple[int, int, int, int], Path] = {}
+        self.index_path = self.base_dir / INDEX_FILENAME
+        self._last_indexed: Optional[str] = None
 
     def get_hourly_dir(self, timestamp: datetime) -> Path:
         """Get directory for specific hour.
@@ -30,26 +50,64 @@ class ArchiveManager:
         Returns:
             Path to hourly directory (data/YYYY-MM/DD-HH)
         """
-        year_month = timestamp.strftime("%Y-%m")
-        day_hour = timestamp.strftime("%d-%H")
-        return self.base_dir / year_month / day_hour
+        key = (timestamp.year, timestamp.month, timestamp.day, timestamp.hour)
+        hour_dir = self._hourly_dir_cache.get(key)
+        if hour_dir is None:
+            if len(self._hourly_dir_cache) >= HOURLY_DIR_CACHE_SIZE:
+                self._hourly_dir_cache.clear()
+            year_month = timestamp.strftime("%Y-%m")
+            day_hour = timestamp.strftime("%d-%H")
+            hour_dir = self._hourly_dir_cache[key] = self.base_dir / year_month / day_hour
+        return hour_dir
 
-    @staticmethod
-    def get_model_filename(model_name: str) -> str:
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory, unless this manager already did so.
+
+        Writes recreate the directory if it was deleted after being remembered here.
+        """
+        if path in self._created_dirs:
+            return
+        if len(self._created_dirs) >= HOURLY_DIR_CACHE_SIZE:
+            self._created_dirs.clear()
+        path.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(path)
+
+    def get_model_filename(self, model_name: str) -> str:
         """Get path to specific visualization for a specific hour."""
+        filename = self._filename_cache.get(model_name)
+        if filename is None:
+            safe_name = model_name.replace(" ", "_").replace("/", "_")
+            filename = self._filename_cache[model_name] = f"{safe_name}.html.gz"
+        return filename
 
-        safe_name = model_name.replace(" ", "_").replace("/", "_")
-        return f"{safe_name}.html"
+    def get_legacy_model_filename(self, model_name: str) -> str:
+        """Get path to an uncompressed visualization, as stored by older versions."""
+        return self.get_model_filename(model_name).removesuffix(".gz")
 
     def find_latest_dir(self) -> Optional[Path]:
-        """Find the most recent hourly directory."""
-        latest_year_month = max((d for d in self.base_dir.iterdir() if d.is_dir()), key=lambda p: p.name, default=None)
+        """Find the most recent hourly directory.
+
+        Uses the last index entry, falls back to scanning the archive if the index is missing or broken.
+        """
+        indexed = self._read_last_index_entry()
+        if indexed is not None and (self.base_dir / indexed).is_dir():
+            self._last_indexed = indexed
+            logger.info("latest_found", hour_dir=indexed, source="index")
+            return self.base_dir / indexed
+
+        latest_dir = self._scan_latest_dir()
+        if latest_dir is not None:
+            # Rebuild the index, so the next lookup doesn't need the scan
+            self._append_index_entry(latest_dir)
+        return latest_dir
+
+    def _scan_latest_dir(self) -> Optional[Path]:
+        """Find the most recent hourly directory by scanning the archive."""
+        latest_year_month = self._find_latest_subdir(self.base_dir)
         if not latest_year_month:
             return None
 
-        latest_day_hour = max(
-            (d for d in latest_year_month.iterdir() if d.is_dir()), key=lambda p: p.name, default=None
-        )
+        latest_day_hour = self._find_latest_subdir(Path(latest_year_month.path))
         if not latest_day_hour:
             return None
 
@@ -57,8 +115,75 @@ class ArchiveManager:
             "latest_found",
             year_month=latest_year_month.name,
             day_hour=latest_day_hour.name,
+            source="scan",
         )
-        return latest_day_hour
+        return Path(latest_day_hour.path)
+
+    def _read_last_index_entry(self) -> Optional[str]:
+        """Read the hour directory recorded by the last index entry.
+
+        Returns:
+            Hour directory relative to the base directory, or None if the index is missing or broken
+        """
+        try:
+            with open(self.index_path, "rb") as f:
+                # Entries are short, the tail of the file is enough
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - 4096))
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+
+        last_line = next((line for line in reversed(lines) if line.strip()), None)
+        if last_line is None:
+            return None
+
+        try:
+            entry = orjson.loads(last_line)
+            hour_dir = entry["dir"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("archive_index_corrupted", path=str(self.index_path))
+            return None
+
+        return hour_dir if isinstance(hour_dir, str) else None
+
+    def _make_index_line(self, hour_dir: Path) -> Optional[bytes]:
+        """Make an index entry for the hour directory, or None if it's already the last entry."""
+        relative = hour_dir.relative_to(self.base_dir).as_posix()
+        if relative == self._last_indexed:
+            return None
+        self._last_indexed = relative
+        return orjson.dumps({"dir": relative}) + b"\n"
+
+    def _append_index_entry(self, hour_dir: Path) -> None:
+        line = self._make_index_line(hour_dir)
+        if line is not None:
+            self._append_index_line(self.index_path, line)
+
+    @staticmethod
+    def _append_index_line(index_path: Path, line: bytes) -> None:
+        """Append an index entry, terminating a partially written last entry first."""
+        with open(index_path, "a+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
+
+    @staticmethod
+    def _find_latest_subdir(path: Path) -> Optional[os.DirEntry[str]]:
+        """Find the subdirectory with the greatest name.
+
+        Uses os.scandir, whose entries know their type from the directory listing,
+        so there is no extra stat call per entry.
+        """
+        with os.scandir(path) as entries:
+            return max(
+                (e for e in entries if e.is_dir()),
+                key=lambda e: e.name,
+                default=None,
+            )
 
     async def save_metadata(
         self,
@@ -77,15 +202,18 @@ class ArchiveManager:
             Path to hourly directory
         """
         hour_dir = self.get_hourly_dir(timestamp)
-        hour_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(hour_dir)
 
         metadata = {
             "timestamp": timestamp.isoformat(),
             "models": models,
             "prompt": prompt,
         }
-        async with aiofiles.open(hour_dir / "metadata.json", "w") as f:
-            await f.write(json.dumps(metadata, indent=2))
+        await self._write_bytes(hour_dir / "metadata.json", orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+
+        index_line = self._make_index_line(hour_dir)
+        if index_line is not None:
+            await asyncio.to_thread(self._append_index_line, self.index_path, index_line)
 
         logger.info(
             "metadata_saved",
@@ -110,11 +238,10 @@ class ArchiveManager:
             Path to hourly directory
         """
         hour_dir = self.get_hourly_dir(timestamp)
-        hour_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(hour_dir)
 
         # Save weather data
-        async with aiofiles.open(hour_dir / "weather.json", "w") as f:
-            await f.write(weather_json)
+        await self._write_bytes(hour_dir / "weather.json", weather_json.encode())
 
         logger.info(
             "weather_saved",
@@ -131,15 +258,28 @@ class ArchiveManager:
             model_name: Name of the AI model
             html: Generated HTML content
         """
+        await self.save_visualizations_batch(timestamp, {model_name: html})
+
+    async def save_visualizations_batch(self, timestamp: datetime, visualizations: Dict[str, str]) -> None:
+        """Save several visualizations of the same hour, writing them concurrently.
+
+        Args:
+            timestamp: Hour timestamp
+            visualizations: Dictionary mapping model names to generated HTML content
+        """
         hour_dir = self.get_hourly_dir(timestamp)
-        hour_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(hour_dir)
 
         # Save HTML
-        model_path = hour_dir / self.get_model_filename(model_name)
-        async with aiofiles.open(model_path, "w") as f:
-            await f.write(html)
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(self._write_compressed, hour_dir / self.get_model_filename(model_name), html.encode())
+                for model_name, html in visualizations.items()
+            )
+        )
 
-        logger.info("visualization_saved", timestamp=timestamp.isoformat(), model=model_name)
+        for model_name in visualizations:
+            logger.info("visualization_saved", timestamp=timestamp.isoformat(), model=model_name)
 
     async def load_latest(self, models: List[str]) -> Optional[Dict[str, Any]]:
         """Load the most recent hour's data.
@@ -190,7 +330,19 @@ class ArchiveManager:
         """
 
         hour_dir = self.get_hourly_dir(timestamp)
-        return [model for model in models if not (hour_dir / self.get_model_filename(model)).exists()]
+
+        # One directory listing instead of a stat call per model
+        try:
+            with os.scandir(hour_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+
+        return [
+            model
+            for model in models
+            if self.get_model_filename(model) not in present and self.get_legacy_model_filename(model) not in present
+        ]
 
     async def _load_hour_data(self, hour_dir: Path, models: List[str]) -> Dict[str, Any]:
         """Load data from a specific hour directory.
@@ -201,32 +353,104 @@ class ArchiveManager:
         Returns:
             Dictionary with timestamp, weather, and visualizations
         """
-        # Load weather data
-        weather_path = hour_dir / "weather.json"
-        weather_data = None
-        if weather_path.exists():
-            async with aiofiles.open(weather_path, "r") as f:
-                weather_data = json.loads(await f.read())
-
-        metadata_path = hour_dir / "metadata.json"
-        metadata = {}
-        if metadata_path.exists():
-            async with aiofiles.open(metadata_path, "r") as f:
-                metadata = json.loads(await f.read())
+        # Issue all reads at once instead of waiting for each file in turn
+        weather_data, metadata, *model_htmls = await asyncio.gather(
+            self._read_json(hour_dir / "weather.json"),
+            self._read_json(hour_dir / "metadata.json"),
+            *(self._read_visualization(hour_dir, model_name) for model_name in models),
+        )
 
         visualizations = {}
         missing_models = []
-        for model_name in models:
-            model_path = hour_dir / self.get_model_filename(model_name)
-            if model_path.exists():
-                async with aiofiles.open(model_path, "r") as f:
-                    visualizations[model_name] = await f.read()
+        for model_name, html in zip(models, model_htmls):
+            if html is not None:
+                visualizations[model_name] = html
             else:
                 missing_models.append(model_name)
 
         return {
-            "timestamp": metadata.get("timestamp", hour_dir.name),
+            "timestamp": (metadata or {}).get("timestamp", hour_dir.name),
             "weather": weather_data,
             "visualizations": visualizations,
             "missing_visualizations": missing_models,
         }
+
+    @staticmethod
+    async def _read_bytes(path: Path) -> Optional[bytes]:
+        """Read a whole file in a single worker thread dispatch.
+
+        Returns:
+            File content, or None if the file doesn't exist
+        """
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            return None
+
+    @classmethod
+    async def _write_bytes(cls, path: Path, data: bytes) -> None:
+        """Write a whole file atomically in a single worker thread dispatch."""
+        await asyncio.to_thread(cls._atomic_write, path, data)
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        """Write to a temporary file and move it over the target.
+
+        Readers see either the old or the new content, never a partially written file.
+        Each write gets its own temporary file, so concurrent writes to the same target don't collide.
+        """
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        except FileNotFoundError:
+            # The directory was removed since it was created (e.g. old hours deleted by hand)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # mkstemp creates the file owner-only, keep archive files readable like before
+                os.fchmod(f.fileno(), 0o644)
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def _write_compressed(cls, path: Path, data: bytes) -> None:
+        """Gzip the data and write it atomically."""
+        cls._atomic_write(path, gzip.compress(data, compresslevel=VISUALIZATION_COMPRESSLEVEL))
+
+    async def _read_visualization(self, hour_dir: Path, model_name: str) -> Optional[str]:
+        """Read a visualization, falling back to the uncompressed file of older versions.
+
+        Returns:
+            Visualization HTML, or None if it doesn't exist or is corrupted
+        """
+        path = hour_dir / self.get_model_filename(model_name)
+        content: Optional[bytes]
+        try:
+            content = await asyncio.to_thread(self._read_compressed, path)
+        except FileNotFoundError:
+            content = await self._read_bytes(hour_dir / self.get_legacy_model_filename(model_name))
+        except (OSError, EOFError, zlib.error) as e:
+            # A damaged file only loses its own model, the rest of the hour still loads
+            logger.warning("visualization_corrupted", path=str(path), error=str(e))
+            return None
+        return content.decode() if content is not None else None
+
+    @staticmethod
+    def _read_compressed(path: Path) -> bytes:
+        return gzip.decompress(path.read_bytes())
+
+    @classmethod
+    async def _read_json(cls, path: Path) -> Optional[Any]:
+        """Read a JSON file.
+
+        Returns:
+            Parsed content, or None if the file doesn't exist
+        """
+        content = await cls._read_bytes(path)
+        if content is None:
+            return None
+        return orjson.loads(content)
@@ -1,8 +1,7 @@
 """OpenWeather API client."""
 
-import json
-
 import httpx
+import orjson
 import structlog
 
 from ..config import WeatherConfig
@@ -21,6 +20,9 @@ class WeatherClient:
         """
         self.config = config
         self.base_url = "https://api.openweathermap.org/data/3.0"
+        # One client for the app's lifetime, closed by the scheduler on shutdown. Fetches are hourly,
+        # long after the idle connection expires, so each fetch still opens a new connection.
+        self.client = httpx.AsyncClient(base_url=self.base_url, http2=True, timeout=config.timeout)
 
     async def get_current_weather(self) -> str:
         """Fetch current weather data from OpenWeather One Call API 3.0.
@@ -32,23 +34,25 @@ class WeatherClient:
             httpx.HTTPStatusError: If API request fails
             ValueError: If response is not valid JSON
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/onecall",
-                params={
-                    "lat": self.config.lat,
-                    "lon": self.config.lon,
-                    "appid": self.config.api_key,
-                    "units": self.config.units,
-                },
-                timeout=self.config.timeout,
-            )
-            response.raise_for_status()
-
-            weather = response.json()
-            current = weather["current"]
-            current_str = json.dumps(current)
-
-            logger.info("weather_fetched", api_version="3.0")
-
-            return current_str
+        response = await self.client.get(
+            "/onecall",
+            params={
+                "lat": self.config.lat,
+                "lon": self.config.lon,
+                "appid": self.config.api_key,
+                "units": self.config.units,
+            },
+        )
+        response.raise_for_status()
+
+        weather = orjson.loads(response.content)
+        current = weather["current"]
+        current_str = orjson.dumps(current).decode()
+
+        logger.info("weather_fetched", api_version="3.0")
+
+        return current_str
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.aclose()
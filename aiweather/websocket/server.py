@@ -1,14 +1,17 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, Optional, Set
 
+import orjson
 import structlog
 from fastapi import WebSocket, WebSocketDisconnect
 
-from ..ai.normalizer import HtmlNormalizer
 from ..config import Settings
 from ..state import StateService
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger()
 
+BROADCAST_LOG_INTERVAL = 100
+
 
 class ConnectionManager:
     """Manages WebSocket connections."""
@@ -22,8 +25,20 @@ class ConnectionManager:
         """
         self.settings = settings
         self.state_service = state_service
-        self.normalizer = HtmlNormalizer()
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+
+        # Model list and prompt don't change while running, so these are built just once
+        self._enabled_models = tuple(settings.get_enabled_ai_model_names())
+        self._config_info_message: Dict[str, Any] = {
+            "type": "config_info",
+            "prompt_template": settings.prompt.template,
+            "models": self._enabled_models,
+        }
+
+        self._broadcast_count = 0
+
+        # Last serialized visualization message per model: (raw_html, status, payload)
+        self._visualization_payloads: Dict[str, tuple[Optional[str], str, bytes]] = {}
 
     async def handle(self, websocket: WebSocket) -> None:
         """Handle the WebSocket connection lifecycle."""
@@ -48,18 +63,11 @@ class ConnectionManager:
             websocket: WebSocket connection
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         logger.info("client_connected", total=len(self.active_connections))
 
-        # Send config info first
-        await self.send_to_client(self.make_config_info_message(), websocket)
-
-        # Send current weather data if available
-        await self.send_to_client(self.make_weather_message(), websocket)
-
-        # Send current visualizations if available
-        for model_name in self.settings.get_enabled_ai_model_names():
-            await self.send_to_client(self.make_visualization_message(model_name), websocket)
+        # Send the whole initial state in a single frame
+        await self.send_to_client(self.make_snapshot_message(), websocket)
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Disconnect a client.
@@ -67,8 +75,7 @@ class ConnectionManager:
         Args:
             websocket: WebSocket connection to remove
         """
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
         logger.info("client_disconnected", total=len(self.active_connections))
 
     async def send_to_client(self, message: Optional[Dict[str, Any]], websocket: WebSocket) -> None:
@@ -83,7 +90,7 @@ class ConnectionManager:
             return
 
         try:
-            await websocket.send_json(message)
+            await websocket.send_bytes(orjson.dumps(message))
         except Exception as e:
             logger.warning("send_failed", error=str(e))
             self.disconnect(websocket)
@@ -98,19 +105,36 @@ class ConnectionManager:
             # No message to send
             return
 
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                disconnected.append(connection)
-                logger.warning("send_failed", client=connection.client, error=str(e))
+        # Serialize once for all clients
+        await self._broadcast_payload(orjson.dumps(message), message["type"])
+
+    async def _broadcast_payload(self, payload: bytes, message_type: str) -> None:
+        """Send an already serialized message to all connected clients concurrently.
+
+        Messages go out as binary frames holding UTF-8 JSON, which skips the
+        text frame encode step for large HTML payloads.
+
+        Args:
+            payload: Serialized message
+            message_type: Type of the message, for logging
+        """
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_bytes(payload) for connection in connections),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        for connection, result in zip(connections, results):
+            if isinstance(result, BaseException):
+                logger.warning("send_failed", client=connection.client, error=str(result))
+                self.disconnect(connection)
 
-        logger.info("broadcast_sent", recipients=len(self.active_connections), message=message["type"])
+        # Broadcasts are frequent while models stream, so only every Nth is logged at info level
+        self._broadcast_count += 1
+        logger.debug("broadcast_sent", recipients=len(self.active_connections), message=message_type)
+        if self._broadcast_count % BROADCAST_LOG_INTERVAL == 0:
+            logger.info("broadcasts_sent", total=self._broadcast_count, recipients=len(self.active_connections))
 
     async def broadcast_weather(self) -> None:
         """Broadcast weather update to all clients."""
@@ -122,15 +146,46 @@ class ConnectionManager:
         Args:
             model_name: Name of the AI model
         """
-        await self.broadcast(self.make_visualization_message(model_name))
+        await self._broadcast_payload(self._make_visualization_payload(model_name), "visualization_update")
 
-    def make_config_info_message(self) -> Dict[str, Any]:
+    def _make_visualization_payload(self, model_name: str) -> bytes:
+        """Serialize a visualization message, reusing the last payload if nothing changed since.
+
+        The cache entry holds a reference to the raw HTML it was built from,
+        so its identity can't be reused by another string while it's cached.
+        """
+        raw_html = self.state_service.current_visualizations.get(model_name)
+        status = self.state_service.visualization_status.get(model_name, "up_to_date")
+
+        cached = self._visualization_payloads.get(model_name)
+        if cached is not None and cached[0] is raw_html and cached[1] == status:
+            return cached[2]
+
+        payload = orjson.dumps(self.make_visualization_message(model_name))
+        self._visualization_payloads[model_name] = (raw_html, status, payload)
+        return payload
+
+    def make_snapshot_message(self) -> Dict[str, Any]:
+        normalized = self.state_service.current_normalized_visualizations
+        raw = self.state_service.current_visualizations
+        status = self.state_service.visualization_status
         return {
-            "type": "config_info",
-            "prompt_template": self.settings.prompt.template,
-            "models": self.settings.get_enabled_ai_model_names(),
+            "type": "snapshot",
+            "config": self.make_config_info_message(),
+            "weather": self.make_weather_message(),
+            "visualizations": {
+                model_name: {
+                    "html": normalized.get(model_name),
+                    "raw_html": raw.get(model_name),
+                    "status": status.get(model_name, "up_to_date"),
+                }
+                for model_name in self._enabled_models
+            },
         }
 
+    def make_config_info_message(self) -> Dict[str, Any]:
+        return self._config_info_message
+
     def make_weather_message(self) -> Optional[Dict[str, Any]]:
         if self.state_service.current_weather is None:
             return None
@@ -143,12 +198,7 @@ class ConnectionManager:
 
     def make_visualization_message(self, model_name: str) -> Optional[Dict[str, Any]]:
         raw_html = self.state_service.current_visualizations.get(model_name)
-
-        # Clean up the AI output
-        html = None
-        if raw_html is not None:
-            html = self.normalizer.normalize(raw_html)
-
+        html = self.state_service.current_normalized_visualizations.get(model_name)
         status = self.state_service.visualization_status.get(model_name, "up_to_date")
 
         return {
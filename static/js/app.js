@@ -51,6 +51,17 @@ ws.on('status', (status) => {
     statusEl.className = `status ${status}`;
 });
 
+// Initial state sent on connect
+ws.on('snapshot', (data) => {
+    ws.emit('config_info', data.config);
+    if (data.weather) {
+        ws.emit('weather_data', data.weather);
+    }
+    Object.entries(data.visualizations).forEach(([modelName, viz]) => {
+        grid.updateVisualization(modelName, viz.html, viz.raw_html, viz.status);
+    });
+});
+
 ws.on('config_info', (data) => {
     currentConfig = data;
     grid.setModels(data.models);
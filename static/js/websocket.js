@@ -5,10 +5,13 @@ class WeatherWebSocket {
         this.reconnectAttempts = 0;
         this.reconnectDelay = 1000;
         this.listeners = new Map();
+        this.decoder = new TextDecoder();
     }
 
     connect() {
         this.ws = new WebSocket(this.url);
+        // Server sends JSON as binary frames
+        this.ws.binaryType = 'arraybuffer';
 
         this.ws.onopen = () => {
             console.log('WebSocket connected');
@@ -18,7 +21,8 @@ class WeatherWebSocket {
 
         this.ws.onmessage = (event) => {
             try {
-                const message = JSON.parse(event.data);
+                const data = typeof event.data === 'string' ? event.data : this.decoder.decode(event.data);
+                const message = JSON.parse(data);
                 this.emit(message.type, message);
             } catch (error) {
                 console.error('Failed to parse message:', error);
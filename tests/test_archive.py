@@ -0,0 +1,118 @@
+import gzip
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+from aiweather.storage.archive import INDEX_FILENAME, ArchiveManager
+
+HOUR = datetime(2025, 1, 2, 3)
+LATER_HOUR = datetime(2025, 1, 2, 4)
+
+
+def read_index(base_dir: Path) -> list[bytes]:
+    return (base_dir / INDEX_FILENAME).read_bytes().splitlines()
+
+
+async def test_find_latest_dir_uses_index(tmp_path: Path) -> None:
+    archive = ArchiveManager(tmp_path)
+    await archive.save_metadata(HOUR, ["m"], "prompt")
+    await archive.save_metadata(LATER_HOUR, ["m"], "prompt")
+
+    assert ArchiveManager(tmp_path).find_latest_dir() == archive.get_hourly_dir(LATER_HOUR)
+
+
+async def test_index_skips_duplicate_entries(tmp_path: Path) -> None:
+    archive = ArchiveManager(tmp_path)
+    await archive.save_metadata(HOUR, ["m"], "prompt")
+    await archive.save_metadata(HOUR, ["m"], "prompt")
+
+    # A restarted manager resumes from the index and doesn't repeat the entry either
+    restarted = ArchiveManager(tmp_path)
+    restarted.find_latest_dir()
+    await restarted.save_metadata(HOUR, ["m"], "prompt")
+
+    assert read_index(tmp_path) == [b'{"dir":"2025-01/02-03"}']
+
+
+async def test_find_latest_dir_scans_without_index(tmp_path: Path) -> None:
+    await ArchiveManager(tmp_path).save_metadata(LATER_HOUR, ["m"], "prompt")
+    (tmp_path / INDEX_FILENAME).unlink()
+
+    archive = ArchiveManager(tmp_path)
+    assert archive.find_latest_dir() == archive.get_hourly_dir(LATER_HOUR)
+    # The index is rebuilt from the scan
+    assert read_index(tmp_path) == [b'{"dir":"2025-01/02-04"}']
+
+
+async def test_find_latest_dir_scans_when_indexed_dir_was_deleted(tmp_path: Path) -> None:
+    archive = ArchiveManager(tmp_path)
+    await archive.save_metadata(HOUR, ["m"], "prompt")
+    await archive.save_metadata(LATER_HOUR, ["m"], "prompt")
+    shutil.rmtree(archive.get_hourly_dir(LATER_HOUR))
+
+    assert ArchiveManager(tmp_path).find_latest_dir() == archive.get_hourly_dir(HOUR)
+
+
+async def test_index_recovers_from_torn_last_line(tmp_path: Path) -> None:
+    await ArchiveManager(tmp_path).save_metadata(HOUR, ["m"], "prompt")
+    with open(tmp_path / INDEX_FILENAME, "ab") as f:
+        f.write(b'{"dir":"2025-01/0')
+
+    archive = ArchiveManager(tmp_path)
+    assert archive.find_latest_dir() == archive.get_hourly_dir(HOUR)
+
+    await archive.save_metadata(LATER_HOUR, ["m"], "prompt")
+    assert read_index(tmp_path)[-1] == b'{"dir":"2025-01/02-04"}'
+    assert ArchiveManager(tmp_path).find_latest_dir() == archive.get_hourly_dir(LATER_HOUR)
+
+
+async def test_visualization_roundtrip(tmp_path: Path) -> None:
+    archive = ArchiveManager(tmp_path)
+    await archive.save_visualizations_batch(HOUR, {"Model A": "<html>a</html>", "m/b": "<html>b</html>"})
+
+    data = await archive.load_hour(HOUR, ["Model A", "m/b", "missing"])
+
+    assert data is not None
+    assert data["visualizations"] == {"Model A": "<html>a</html>", "m/b": "<html>b</html>"}
+    assert data["missing_visualizations"] == ["missing"]
+    assert not list(archive.get_hourly_dir(HOUR).glob("*.tmp"))
+
+
+async def test_load_falls_back_to_legacy_html(tmp_path: Path) -> None:
+    archive = ArchiveManager(tmp_path)
+    hour_dir = archive.get_hourly_dir(HOUR)
+    hour_dir.mkdir(parents=True)
+    (hour_dir / "Old_Model.html").write_text("<html>legacy</html>")
+
+    data = await archive.load_hour(HOUR, ["Old Model"])
+
+    assert data is not None
+    assert data["visualizations"] == {"Old Model": "<html>legacy</html>"}
+    assert await archive.get_missing_models(HOUR, ["Old Model", "New Model"]) == ["New Model"]
+
+
+async def test_corrupted_visualization_is_reported_missing(tmp_path: Path) -> None:
+    archive = ArchiveManager(tmp_path)
+    await archive.save_weather(HOUR, '{"temp": 1}')
+    await archive.save_visualizations_batch(HOUR, {"good": "<html>good</html>"})
+    hour_dir = archive.get_hourly_dir(HOUR)
+    compressed = gzip.compress(b"<html>" + b"x" * 1000 + b"</html>")
+    (hour_dir / "truncated.html.gz").write_bytes(compressed[: len(compressed) // 2])
+    (hour_dir / "garbage.html.gz").write_bytes(b"not gzip")
+
+    data = await archive.load_hour(HOUR, ["good", "truncated", "garbage"])
+
+    assert data is not None
+    assert data["weather"] == {"temp": 1}
+    assert data["visualizations"] == {"good": "<html>good</html>"}
+    assert data["missing_visualizations"] == ["truncated", "garbage"]
+
+
+async def test_save_recreates_deleted_hour_dir(tmp_path: Path) -> None:
+    archive = ArchiveManager(tmp_path)
+    await archive.save_metadata(HOUR, ["m"], "prompt")
+    shutil.rmtree(archive.get_hourly_dir(HOUR))
+
+    await archive.save_visualization(HOUR, "m", "<html>m</html>")
+
+    assert await archive.get_missing_models(HOUR, ["m"]) == []
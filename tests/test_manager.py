@@ -0,0 +1,75 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from aiweather.ai.base import AIProvider
+from aiweather.ai.manager import AIManager
+from aiweather.config import Settings
+
+
+class FakeProvider(AIProvider):
+    """Provider returning the model id as HTML after a short delay."""
+
+    async def generate_html(
+        self,
+        prompt: str,
+        model_id: str,
+        on_chunk: Callable[[str], Awaitable[None]] | None = None,
+        **kwargs: object,
+    ) -> str:
+        await asyncio.sleep(0.01)
+        if model_id == "broken":
+            raise RuntimeError("generation failed")
+        return f"<html>{model_id}</html>"
+
+    async def is_available(self) -> bool:
+        return True
+
+
+def make_manager(model_ids: list[str], max_concurrent: int) -> AIManager:
+    settings = Settings(
+        weather={"api_key": "key", "lat": 0, "lon": 0},
+        prompt={"template": "Weather: {weather_json}"},
+        ai_models=[{"name": model_id, "model_id": model_id} for model_id in model_ids],
+        ai={"max_concurrent": max_concurrent},
+    )
+    ai_manager = AIManager(settings)
+    ai_manager.providers["ollama"] = FakeProvider()
+    return ai_manager
+
+
+@pytest.fixture(autouse=True)
+def error_template(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Don't depend on the static template file
+    monkeypatch.setattr(AIManager, "_error_html", lambda self, model_name, error: f"error: {error}")
+
+
+@pytest.mark.parametrize("max_concurrent", [0, 1, 3])
+async def test_failing_update_does_not_stop_other_models(max_concurrent: int) -> None:
+    ai_manager = make_manager(["m0", "m1", "m2"], max_concurrent)
+    completed: list[str] = []
+
+    async def on_update(model_name: str, html: str, is_complete: bool) -> None:
+        if model_name == "m0":
+            raise OSError("No space left on device")
+        completed.append(model_name)
+
+    results = await ai_manager.generate_all('{"temp": 1}', on_update=on_update)
+
+    assert sorted(completed) == ["m1", "m2"]
+    assert results == {"m0": "error: No space left on device", "m1": "<html>m1</html>", "m2": "<html>m2</html>"}
+
+
+@pytest.mark.parametrize("max_concurrent", [0, 2])
+async def test_failed_generation_reports_error_page(max_concurrent: int) -> None:
+    ai_manager = make_manager(["m0", "broken"], max_concurrent)
+    updates: dict[str, tuple[str, bool]] = {}
+
+    async def on_update(model_name: str, html: str, is_complete: bool) -> None:
+        updates[model_name] = (html, is_complete)
+
+    results = await ai_manager.generate_all("{}", on_update=on_update)
+
+    assert results == {"m0": "<html>m0</html>", "broken": "error: generation failed"}
+    assert updates == {"m0": ("<html>m0</html>", True), "broken": ("error: generation failed", True)}
@@ -0,0 +1,86 @@
+import pytest
+
+from aiweather.ai.normalizer import (
+    CodeBlockHtmlNormalizer,
+    FindDoctypeNormalizer,
+    FindHtmlNormalizer,
+    HtmlNormalizer,
+)
+
+DOCUMENT = "<!DOCTYPE html>\n<html><body><p>Sunny</p></body></html>"
+
+
+@pytest.fixture
+def normalizer() -> HtmlNormalizer:
+    return HtmlNormalizer()
+
+
+def test_bare_document_is_returned_stripped(normalizer: HtmlNormalizer) -> None:
+    assert normalizer.normalize(f"\n  {DOCUMENT}\n\n") == DOCUMENT
+
+
+def test_uppercase_doctype_takes_fast_path(normalizer: HtmlNormalizer) -> None:
+    html = "<!DOCTYPE HTML>\n<html><body>Rain</body></html>"
+    assert normalizer.normalize(f"{html}\n") == html
+
+
+def test_closing_tag_inside_script_keeps_whole_document(normalizer: HtmlNormalizer) -> None:
+    html = "<!DOCTYPE html><html><script>const s = '</html>';</script><p>Snow</p></html>"
+    assert normalizer.normalize(html) == html
+
+
+def test_document_is_cut_out_of_surrounding_text(normalizer: HtmlNormalizer) -> None:
+    assert normalizer.normalize(f"Here it is:\n{DOCUMENT}\nEnjoy!") == DOCUMENT
+
+
+def test_html_without_doctype_keeps_closing_tag(normalizer: HtmlNormalizer) -> None:
+    html = '<html lang="en"><body>Fog</body></html>'
+    assert normalizer.normalize(f"Sure!\n{html}\nBye") == html
+
+
+def test_code_block_is_returned_with_fences(normalizer: HtmlNormalizer) -> None:
+    block = "```html\n<div>Wind</div>\n```"
+    assert normalizer.normalize(f"Here:\n{block}\nDone") == block
+
+
+def test_partial_document_falls_through_to_other_strategies(normalizer: HtmlNormalizer) -> None:
+    # Streamed output that isn't complete yet is passed through unchanged
+    partial = "<!DOCTYPE html>\n<html><body><p>Clou"
+    assert normalizer.normalize(partial) == partial
+
+    # A probed strategy that doesn't match doesn't prevent the others from being tried
+    with_block = "<!DOCTYPE html>\n<html><body>```js\nlet t = 1;\n```"
+    assert normalizer.normalize(with_block) == "```js\nlet t = 1;\n```"
+
+
+def test_plain_text_is_returned_unchanged(normalizer: HtmlNormalizer) -> None:
+    assert normalizer.normalize("I can't do that.") == "I can't do that."
+
+
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        ("<html>a</html>", "<html>a</html>"),
+        ("<!DOCTYPE html>", None),
+        ("<html><body>", None),
+        ("no html", None),
+    ],
+)
+def test_find_html_strategy(html: str, expected: str | None) -> None:
+    assert FindHtmlNormalizer().normalize(html) == expected
+
+
+def test_find_doctype_strategy_requires_closing_tag() -> None:
+    assert FindDoctypeNormalizer().normalize(f"x{DOCUMENT}y") == DOCUMENT
+    assert FindDoctypeNormalizer().normalize("<!DOCTYPE html><html>") is None
+
+
+def test_code_block_strategy_requires_closing_fence() -> None:
+    assert CodeBlockHtmlNormalizer().normalize("```html\n<p>x</p>\n```") == "```html\n<p>x</p>\n```"
+    assert CodeBlockHtmlNormalizer().normalize("```html\n<p>x</p>") is None
+
+
+def test_probe_picks_strategy_from_start(normalizer: HtmlNormalizer) -> None:
+    assert isinstance(normalizer.probe(f"  {DOCUMENT}"), FindDoctypeNormalizer)
+    assert isinstance(normalizer.probe("<html><body></body></html>"), FindHtmlNormalizer)
+    assert normalizer.probe("Here it is: <html></html>") is None
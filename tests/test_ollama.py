@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from aiweather.ai.ollama import ChunkEmitter
+
+
+class RecordingCallback:
+    """Async callback that records deliveries and blocks until released."""
+
+    def __init__(self) -> None:
+        self.delivered: list[str] = []
+        self.running = 0
+        self.max_running = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, snapshot: str) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.release.wait()
+            self.delivered.append(snapshot)
+        finally:
+            self.running -= 1
+
+
+async def test_emit_keeps_only_newest_snapshot_while_delivering() -> None:
+    callback = RecordingCallback()
+    emitter = ChunkEmitter(callback)
+
+    emitter.emit("a")
+    await asyncio.sleep(0)
+    emitter.emit("ab")
+    emitter.emit("abc")
+
+    callback.release.set()
+    await emitter.flush()
+
+    assert callback.delivered == ["a", "abc"]
+    assert callback.max_running == 1
+
+
+async def test_flush_delivers_final_snapshot_after_pending_ones() -> None:
+    callback = RecordingCallback()
+    emitter = ChunkEmitter(callback)
+
+    emitter.emit("a")
+    emitter.emit("ab")
+    callback.release.set()
+    await emitter.flush("abc")
+
+    assert callback.delivered == ["a", "ab", "abc"]
+    assert callback.max_running == 1
+
+
+async def test_flush_raises_delivery_error() -> None:
+    async def failing(snapshot: str) -> None:
+        raise ValueError(snapshot)
+
+    emitter = ChunkEmitter(failing)
+    emitter.emit("a")
+
+    with pytest.raises(ValueError, match="a"):
+        await emitter.flush()
+
+
+async def test_emit_raises_error_of_finished_delivery() -> None:
+    async def failing(snapshot: str) -> None:
+        raise ValueError(snapshot)
+
+    emitter = ChunkEmitter(failing)
+    emitter.emit("a")
+    await asyncio.sleep(0)
+
+    with pytest.raises(ValueError, match="a"):
+        emitter.emit("ab")
+
+
+async def test_cancel_waits_for_running_delivery() -> None:
+    unwound = asyncio.Event()
+
+    async def slow(snapshot: str) -> None:
+        try:
+            await asyncio.sleep(10)
+        finally:
+            # Cleanup that suspends, like a save still in progress
+            await asyncio.sleep(0)
+            unwound.set()
+
+    emitter = ChunkEmitter(slow)
+    emitter.emit("a")
+    await asyncio.sleep(0)
+    await emitter.cancel()
+
+    assert unwound.is_set()
+
+
+async def test_cancel_drops_queued_snapshot() -> None:
+    callback = RecordingCallback()
+    emitter = ChunkEmitter(callback)
+
+    emitter.emit("a")
+    await asyncio.sleep(0)
+    emitter.emit("ab")
+    await emitter.cancel()
+    callback.release.set()
+    await emitter.flush()
+
+    assert callback.delivered == []